@@ -0,0 +1,66 @@
+"""aiohttp session lifecycle and JSON-RPC batching shared by AsyncWALLET and AsyncHSD."""
+import logging
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from api._http import _UNBATCHED, _batch_body, _batch_reply
+
+logger = logging.getLogger(__name__)
+
+
+class _AsyncClientMixin:
+    """
+    Turn a synchronous WALLET/HSD client into an aiohttp-based one.
+
+    List it before the synchronous class so its methods take precedence. Subclasses
+    provide an async _request/_make_request; everything here is shared plumbing.
+    """
+
+    _limit: int = 32
+    _client: Optional[aiohttp.ClientSession] = None
+
+    def _open_session(self) -> None:
+        # Requests go through aiohttp, so no pooled requests.Session is created
+        return None
+
+    async def __aenter__(self):
+        """Support async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the aiohttp session when exiting context."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying aiohttp session."""
+        if self._client is not None and not self._client.closed:
+            await self._client.close()
+        logger.debug(f"{type(self).__name__} session closed")
+
+    def _client_session(self) -> aiohttp.ClientSession:
+        # Created lazily so the session is bound to the running event loop
+        if self._client is None or self._client.closed:
+            self._client = aiohttp.ClientSession(
+                base_url=self.base_url,
+                auth=aiohttp.BasicAuth('x', self.api_key),
+                connector=aiohttp.TCPConnector(limit=self._limit, keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+                headers={'Content-Type': 'application/json', 'Accept': 'application/json'}
+            )
+        return self._client
+
+    def _request_timeout(self, method: str) -> aiohttp.ClientTimeout:
+        # Same split as the sync clients: reads are bounded by _timeout, writes by _write_timeout
+        if method == 'get':
+            return aiohttp.ClientTimeout(total=self._timeout)
+        connect, read = self._write_timeout
+        return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+
+    async def _post_batch(self, calls: List[Dict[str, Any]]) -> Any:
+        """Send calls as one JSON-RPC batch, or one request per call to a node that refuses batches."""
+        if self.base_url not in _UNBATCHED:
+            results = _batch_reply(self.base_url, await self.post('/', _batch_body(calls)))
+            if results is not None:
+                return results
+        return [await self._rpc_post(call["method"], call["params"]) for call in calls]
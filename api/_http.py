@@ -0,0 +1,131 @@
+"""JSON-RPC serialization, batching and pooled-session helpers shared by the WALLET and HSD clients."""
+import atexit
+import logging
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from api.serialization import dumps as _dumps
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+@lru_cache(maxsize=128)
+def _rpc_envelope(method: str, id: Optional[str] = None) -> bytes:
+    """Serialized '{"method":...,["id":...,]"params":' prefix of a JSON-RPC call, built once per method."""
+    head = b'{"method":' + _dumps(method)
+    if id is not None:
+        head += b',"id":' + _dumps(id)
+    return head + b',"params":'
+
+
+def _rpc_body(method: str, params: Optional[List[Any]] = None, id: Optional[str] = None) -> bytes:
+    """Serialize a JSON-RPC call; only the params go through the JSON encoder."""
+    return _rpc_envelope(method, id) + (_dumps(params) if params else b'[]') + b'}'
+
+
+def _batch_body(calls: List[Dict[str, Any]]) -> bytes:
+    """Serialize a JSON-RPC batch, tagging each call with its index as the id."""
+    return _dumps([dict(call, id=i) for i, call in enumerate(calls)])
+
+
+def _in_order(response: List[Any]) -> List[Any]:
+    """Sort a JSON-RPC batch response by id; entries without a usable id sort first."""
+    return sorted(response, key=lambda r: (r.get('id') or 0) if isinstance(r, dict) else 0)
+
+
+# Base URLs of nodes that did not answer a JSON-RPC batch with a list. hsd only routes
+# POST bodies with a string "method" to its RPC handler, so an array body gets a 404;
+# after the first refusal calls to that node are sent one by one without trying again.
+_UNBATCHED: Set[str] = set()
+
+
+def _batch_reply(base_url: str, response: Any) -> Optional[List[Any]]:
+    """Return a batch response in call order, or None after noting that base_url refused the batch."""
+    if isinstance(response, list):
+        return _in_order(response)
+    logger.debug(f"JSON-RPC batch not accepted by {base_url} ({response}); sending calls individually")
+    _UNBATCHED.add(base_url)
+    return None
+
+
+class _RpcBatchMixin:
+    """rpc_batch() for clients that provide base_url, post() and _rpc_post()."""
+
+    def rpc_batch(self, calls: List[Tuple[str, List[Any]]]) -> Any:
+        """
+        Send several JSON-RPC calls in a single request.
+
+        Args:
+            calls (list): (method, params) pairs, e.g. [("getnameinfo", ["name"]), ("getblockcount", [])]
+
+        Returns:
+            List of responses in submission order. If the node does not accept batches, each
+            call is sent on its own and its response (or error dictionary) takes its place.
+        """
+        return self._post_batch([{"method": method, "params": params} for method, params in calls])
+
+    def _post_batch(self, calls: List[Dict[str, Any]]) -> Any:
+        """Send calls as one JSON-RPC batch, or one request per call to a node that refuses batches."""
+        if self.base_url not in _UNBATCHED:
+            results = _batch_reply(self.base_url, self.post('/', _batch_body(calls)))
+            if results is not None:
+                return results
+        return [self._rpc_post(call["method"], call["params"]) for call in calls]
+
+
+# Pooled sessions shared by every client talking to the same node, keyed by
+# (host, port, api_key) since the credentials live on the session
+_SESSIONS: Dict[Tuple[str, int, str], requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _build_session(api_key: str) -> requests.Session:
+    """Create a pooled requests session with retries for the wallet or node API."""
+    session = requests.Session()
+    # Credentials go in session.auth so the pool keys on host:port only and
+    # the API key never appears in URLs, logs or error messages
+    session.auth = ('x', api_key)
+    # Only idempotent requests are retried on error statuses so bids, reveals and
+    # transfers are never sent twice; connection failures are still retried for
+    # every method because the request never reached the node.
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        backoff_jitter=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({'GET', 'HEAD', 'OPTIONS'}),
+        respect_retry_after_header=True
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({
+        'Content-Type': 'application/json',
+        'Accept': 'application/json',
+        'Connection': 'keep-alive'
+    })
+    return session
+
+
+def _shared_session(host: str, port: int, api_key: str) -> requests.Session:
+    """Return the session shared by all clients of the given node, creating it on first use."""
+    key = (host, port, api_key)
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = _SESSIONS[key] = _build_session(api_key)
+        return session
+
+
+@atexit.register
+def _close_sessions() -> None:
+    """Close every shared session at interpreter exit."""
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
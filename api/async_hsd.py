@@ -0,0 +1,54 @@
+import asyncio
+import logging
+from typing import Dict, Optional, Union
+
+import aiohttp
+
+from api._aio import _AsyncClientMixin
+from api.hsd import HSD
+from api.serialization import loads as _loads
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncHSD(_AsyncClientMixin, HSD):
+    """
+    An asyncio client for the Handshake (HSD) node API built on aiohttp.
+
+    Every API method of HSD is available and returns an awaitable, so node queries can
+    run alongside wallet queries, e.g.
+    ``await asyncio.gather(hsd.get_info(), wallet.get_balance(id=wallet_id))``.
+    Requires the ``aiohttp`` package, which the app itself does not install.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, host: Optional[str] = None,
+                 port: Optional[int] = None, limit: int = 32):
+        """
+        Initialize the async HSD client, falling back to config.json values.
+
+        Args:
+            api_key (str, optional): HSD API key. Defaults to NODE_API_KEY from config.json.
+            host (str, optional): HSD node host address. Defaults to NODE_HOST from config.json.
+            port (int, optional): HSD node port. Defaults to NODE_PORT from config.json.
+            limit (int, optional): Maximum number of concurrent connections to the node.
+
+        Raises:
+            ValueError: If required configuration (api_key) is missing.
+        """
+        super().__init__(api_key=api_key, host=host, port=port)
+        self._limit = limit
+
+    async def _request(self, method: str, endpoint: str, data: Optional[bytes] = None) -> Dict[str, Union[str, dict]]:
+        """Handle HTTP requests with improved error handling."""
+        try:
+            session = self._client_session()
+            async with session.request(method.upper(), endpoint, data=data,
+                                       timeout=self._request_timeout(method)) as response:
+                response.raise_for_status()
+                return _loads(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            logger.error(f"Request failed: {exc}")
+            return {"error": f"Failed to {method} {endpoint}: {str(exc)}"}
+        except ValueError as exc:
+            logger.error(f"Invalid JSON response: {exc}")
+            return {"error": f"Invalid JSON response from {endpoint}"}
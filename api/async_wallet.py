@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from typing import Awaitable, Dict, Optional, Any
+
+import aiohttp
+
+from api._aio import _AsyncClientMixin
+from api.serialization import loads as _loads
+from api.wallet import _WalletAPI
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWALLET(_AsyncClientMixin, _WalletAPI):
+    """
+    An asyncio client for the Handshake wallet API built on aiohttp.
+
+    Every API method of WALLET except rpc_pipeline is available and returns an awaitable,
+    so independent queries can be issued concurrently, e.g.
+    ``await asyncio.gather(*(wallet.get_wallet_name(n, id) for n in names))``.
+    Requires the ``aiohttp`` package, which the app itself does not install.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, ip_address: Optional[str] = None,
+                 port: Optional[int] = None, limit: int = 32):
+        """
+        Initialize the async Wallet client, falling back to config.json values.
+
+        Args:
+            api_key (str, optional): Wallet API key. Defaults to WALLET_API from config.json.
+            ip_address (str, optional): Wallet node IP address. Defaults to WALLET_ADDRESS from config.json.
+            port (int, optional): Wallet node port. Defaults to WALLET_PORT from config.json.
+            limit (int, optional): Maximum number of concurrent connections to the node.
+
+        Raises:
+            ValueError: If required configuration (api_key) is missing.
+        """
+        super().__init__(api_key=api_key, ip_address=ip_address, port=port)
+        self._limit = limit
+
+    async def _make_request(self, method: str, endpoint: str, data: bytes = b'',
+                            params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Make an HTTP request to the wallet API.
+
+        Args:
+            method (str): HTTP method (get, post, put, delete)
+            endpoint (str): API endpoint
+            data (bytes, optional): Request body data
+            params (dict, optional): Query string parameters
+
+        Returns:
+            Dict[str, Any]: JSON response or error dictionary
+        """
+        try:
+            session = self._client_session()
+            async with session.request(method.upper(), endpoint, data=data, params=params,
+                                       timeout=self._request_timeout(method)) as response:
+                response.raise_for_status()
+                return _loads(await response.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return {"error": f"Request failed: {str(e)}"}
+        except ValueError as e:
+            return {"error": f"Invalid JSON response: {str(e)}"}
+
+    # Core HTTP methods
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Awaitable[Dict[str, Any]]:
+        """Make a GET request to the API."""
+        return self._make_request('get', endpoint, params=params)
+
+    def post(self, endpoint: str, message: bytes = b'') -> Awaitable[Dict[str, Any]]:
+        """Make a POST request to the API."""
+        return self._make_request('post', endpoint, message)
+
+    def put(self, endpoint: str, message: bytes = b'') -> Awaitable[Dict[str, Any]]:
+        """Make a PUT request to the API."""
+        return self._make_request('put', endpoint, message)
+
+    def delete(self, endpoint: str, message: bytes = b'') -> Awaitable[Dict[str, Any]]:
+        """Make a DELETE request to the API."""
+        return self._make_request('delete', endpoint, message)
@@ -1,29 +1,17 @@
-import json
 import logging
-import os
 from typing import Dict, Union, Optional, List
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
 
-# Load configuration from config.json
-CONFIG_FILE = 'config.json'
-if not os.path.exists(CONFIG_FILE):
-    logger.error(f"Configuration file {CONFIG_FILE} not found")
-    raise FileNotFoundError(f"Configuration file {CONFIG_FILE} not found")
+from api._http import _RpcBatchMixin, _rpc_body, _shared_session
+from api.serialization import dumps as _dumps, loads as _loads
+from bot_config import read_config
 
-with open(CONFIG_FILE, 'r') as f:
-    config = json.load(f)
+# Library module: leave handler configuration to the application
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
-class HSD:
+class HSD(_RpcBatchMixin):
     """A client for interacting with the Handshake (HSD) node REST and RPC API."""
 
     def __init__(self, api_key: Optional[str] = None, host: Optional[str] = None, port: Optional[int] = None):
@@ -38,6 +26,7 @@ class HSD:
         Raises:
             ValueError: If required configuration (api_key) is missing.
         """
+        config = read_config()
         self.api_key = api_key or config.get('NODE_API_KEY')
         self.host = host or config.get('NODE_HOST', '127.0.0.1')
         self.port = port if port is not None else config.get('NODE_PORT', 12037)
@@ -46,31 +35,35 @@ class HSD:
             logger.error("NODE_API_KEY is required but not found in config.json or provided as argument")
             raise ValueError("NODE_API_KEY is required. Set it in config.json or pass it as an argument.")
 
-        self.base_url = f'http://x:{self.api_key}@{self.host}:{self.port}'
+        # Credentials are carried by the session, never embedded in the URL
+        self.base_url = f'http://{self.host}:{self.port}'
 
-        # Configure requests session with retries and timeouts
-        self.session = requests.Session()
-        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
-        adapter = HTTPAdapter(max_retries=retries)
-        self.session.mount('http://', adapter)
+        # Same policy as WALLET: 10s for reads, two minutes for writes such as broadcasts
+        self._timeout = 10
+        self._write_timeout = (10, 120)
+        self.session = self._open_session()
         logger.debug(f"Initialized HSD client with base URL: {self.base_url}")
 
+    def _open_session(self) -> requests.Session:
+        # Instances pointing at the same node share one pooled session, so
+        # keep-alive connections outlive any single HSD object
+        return _shared_session(self.host, self.port, self.api_key)
+
     def __enter__(self):
         """Support context manager entry."""
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Close the session when exiting context."""
-        self.session.close()
-        logger.debug("HSD session closed")
+        """Leave the shared session open for other clients; it is closed at interpreter exit."""
 
-    def _request(self, method: str, endpoint: str, data: Optional[str] = None) -> Dict[str, Union[str, dict]]:
+    def _request(self, method: str, endpoint: str, data: Optional[bytes] = None) -> Dict[str, Union[str, dict]]:
         """Handle HTTP requests with improved error handling."""
         url = f"{self.base_url}{endpoint}"
         try:
-            response = getattr(self.session, method)(url, data=data, timeout=10)
+            timeout = self._timeout if method == 'get' else self._write_timeout
+            response = getattr(self.session, method)(url, data=data, timeout=timeout)
             response.raise_for_status()
-            return response.json()
+            return _loads(response.content)
         except requests.RequestException as exc:
             logger.error(f"Request failed: {exc}")
             return {"error": f"Failed to {method} {endpoint}: {str(exc)}"}
@@ -82,14 +75,13 @@ class HSD:
         """Send a GET request to the API."""
         return self._request('get', endpoint)
 
-    def post(self, endpoint: str, message: str = '') -> Dict[str, Union[str, dict]]:
+    def post(self, endpoint: str, message: bytes = b'') -> Dict[str, Union[str, dict]]:
         """Send a POST request to the API."""
         return self._request('post', endpoint, message)
 
     def _rpc_post(self, method: str, params: Optional[List] = None) -> Dict[str, Union[str, dict]]:
         """Helper for RPC POST requests."""
-        payload = {"method": method, "params": params or [], "id": "1"}
-        return self.post('/', json.dumps(payload))
+        return self.post('/', _rpc_body(method, params, id="1"))
 
     # Existing REST API Methods
     def get_info(self) -> Dict[str, Union[str, dict]]:
@@ -119,12 +111,12 @@ class HSD:
 
     def broadcast(self, tx_hex: str) -> Dict[str, Union[str, dict]]:
         """Broadcast a transaction to the node's mempool."""
-        message = json.dumps({"tx": tx_hex})
+        message = _dumps({"tx": tx_hex})
         return self.post('/broadcast/', message)
 
     def broadcast_claim(self, claim: str) -> Dict[str, Union[str, dict]]:
         """Broadcast a claim to the node's mempool."""
-        message = json.dumps({"claim": claim})
+        message = _dumps({"claim": claim})
         return self.post('/claim/', message)
 
     def get_fee_estimate(self, blocks: int) -> Dict[str, Union[str, dict]]:
@@ -134,7 +126,7 @@ class HSD:
     # New REST API Methods
     def reset(self, height: int) -> Dict[str, Union[str, dict]]:
         """Trigger a hard-reset of the blockchain to a specific height."""
-        message = json.dumps({"height": height})
+        message = _dumps({"height": height})
         return self.post('/reset', message)
 
     def get_coin_by_hash_index(self, tx_hash: str, index: int) -> Dict[str, Union[str, dict]]:
@@ -448,6 +440,8 @@ class HSD:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
     # Test the HSD client
     try:
         hsd = HSD()
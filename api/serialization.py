@@ -0,0 +1,31 @@
+"""JSON helpers that use orjson when it is installed and fall back to the stdlib."""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+if orjson is not None:
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes."""
+        return orjson.dumps(obj)
+
+    def dumps_indented(obj: Any) -> bytes:
+        """Serialize obj to human-readable JSON bytes indented by two spaces, ending in a newline."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+    # Accepts bytes directly, skipping the intermediate str decode
+    loads = orjson.loads
+else:
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes."""
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    def dumps_indented(obj: Any) -> bytes:
+        """Serialize obj to human-readable JSON bytes indented by two spaces, ending in a newline."""
+        return json.dumps(obj, indent=2).encode() + b'\n'
+
+    loads = json.loads
@@ -0,0 +1,30 @@
+import os
+from typing import Any, Dict, Tuple
+
+from api.serialization import loads
+
+# Load configuration from config.json
+CONFIG_FILE = 'config.json'
+
+# Parsed config files by path, re-read only when the file's modification time changes
+_config_cache: Dict [ str, Tuple [ int, Dict [ str, Any ] ] ] = { }
+
+
+def read_config ( path: str = CONFIG_FILE ) -> Dict [ str, Any ]:
+    """Returns the parsed config file, raising FileNotFoundError if it doesn't exist."""
+    mtime = os.stat ( path ).st_mtime_ns
+    cached = _config_cache.get ( path )
+    if cached is None or cached [ 0 ] != mtime:
+        with open ( path, 'rb' ) as f:
+            cached = _config_cache [ path ] = ( mtime, loads ( f.read () ) )
+    # Shallow copy so callers can modify their config without touching the cache
+    return dict ( cached [ 1 ] )
+
+
+def load_config ( path: str = CONFIG_FILE ) -> Dict [ str, Any ]:
+    """Loads and returns the current configuration from config.json."""
+    try:
+        return read_config ( path )
+    except FileNotFoundError:
+        # Allow bot to start without config if called directly, but raise for main script
+        return { }
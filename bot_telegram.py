@@ -1,21 +1,32 @@
-import json
-import os
+import queue
+import threading
+import time
+import requests
 import telebot  # pyTelegramBotAPI
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Optional, Tuple
 
-# Load configuration from config.json
-CONFIG_FILE = 'config.json'
+from api.serialization import dumps_indented
+from bot_config import CONFIG_FILE, load_config
 
 
-def load_config () -> Dict [ str, Any ]:
-    """Loads and returns the current configuration from config.json."""
-    if not os.path.exists ( CONFIG_FILE ):
-        # Allow bot to start without config if called directly, but raise for main script
-        return { }
-    with open ( CONFIG_FILE, 'r' ) as f:
-        return json.load ( f )
+# telebot keeps one requests session per thread by default; share a single
+# keep-alive session so the setup prompt (main thread) and the background
+# sender reuse one TLS connection to api.telegram.org
+telebot.apihelper.session = requests.Session ()
 
 
+def _form_request_sender ( method: str, url: str, params: Optional [ Dict [ str, Any ] ] = None,
+                           files: Any = None, timeout: Any = None, proxies: Any = None ) -> requests.Response:
+    """Send Bot API POSTs with a form-encoded body instead of a query string."""
+    session = telebot.apihelper.session
+    if method.lower () == 'post' and not files:
+        # Keeps long HTML messages out of the request line
+        return session.post ( url, data=params, timeout=timeout, proxies=proxies )
+    return session.request ( method, url, params=params, files=files, timeout=timeout, proxies=proxies )
+
+
+telebot.apihelper.CUSTOM_REQUEST_SENDER = _form_request_sender
+
 # Load configuration and initialize bot
 try:
     config = load_config ()
@@ -29,17 +40,158 @@ except Exception as e:
     bot = None
 
 
-def send_telegram_message ( message: str, parse_mode: str = None ) -> None:
-    """Send a message via Telegram bot (Standard Alert)."""
+class _TokenBucket:
+    """Blocking token bucket: allows `rate` sends per second with bursts of up to `capacity`."""
+
+    def __init__ ( self, rate: float, capacity: float ):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic ()
+        self.lock = threading.Lock ()
+
+    def acquire ( self ) -> None:
+        with self.lock:
+            now = time.monotonic ()
+            self.tokens = min ( self.capacity, self.tokens + ( now - self.last ) * self.rate )
+            self.last = now
+            if self.tokens < 1:
+                # Sleep just long enough for one token; holding the lock keeps senders in order
+                time.sleep ( ( 1 - self.tokens ) / self.rate )
+                self.last = time.monotonic ()
+                self.tokens = 1
+            self.tokens -= 1
+
+
+# Stay under the Bot API limits: ~30 messages/s overall and ~1 message/s per chat
+_global_bucket = _TokenBucket ( rate=25, capacity=25 )
+_chat_buckets: Dict [ str, _TokenBucket ] = { }
+_chat_buckets_lock = threading.Lock ()
+
+
+def _throttle ( chat_id: Any ) -> None:
+    """Wait until a message to chat_id fits within the global and per-chat rate limits."""
+    with _chat_buckets_lock:
+        bucket = _chat_buckets.setdefault ( str ( chat_id ), _TokenBucket ( rate=1, capacity=1 ) )
+    _global_bucket.acquire ()
+    bucket.acquire ()
+
+
+def _send_rate_limited ( chat_id: Any, message: str, parse_mode: str = None ) -> None:
+    """Send within the rate limits; on a 429 wait the server's retry_after and retry once."""
+    _throttle ( chat_id )
+    try:
+        bot.send_message ( chat_id, message, parse_mode=parse_mode )
+    except telebot.apihelper.ApiTelegramException as e:
+        if e.error_code != 429:
+            raise
+        retry_after = ( ( e.result_json or { } ).get ( 'parameters' ) or { } ).get ( 'retry_after', 1 )
+        print ( f"Telegram rate limit hit, retrying in {retry_after}s" )
+        time.sleep ( retry_after )
+        _throttle ( chat_id )
+        bot.send_message ( chat_id, message, parse_mode=parse_mode )
+
+
+def send_telegram_message ( message: str, parse_mode: str = None ) -> bool:
+    """Send a message via Telegram bot (Standard Alert). Returns True if it was delivered."""
     if not bot or not TELEGRAM_CHAT_ID:
         print ( "Telegram configuration missing." )
-        return
+        return False
 
     try:
-        bot.send_message ( TELEGRAM_CHAT_ID, message, parse_mode=parse_mode )
+        _send_rate_limited ( TELEGRAM_CHAT_ID, message, parse_mode=parse_mode )
         print ( "Telegram message sent successfully" )
+        return True
     except Exception as e:
         print ( f"Failed to send Telegram message: {e}" )
+        return False
+
+
+# Outgoing alerts are delivered by a background thread so RPC work is not held
+# up by round-trips to the Telegram API
+_outbox: "queue.Queue[Tuple[str, Optional[str], Optional[Callable[[], None]]]]" = queue.Queue ()
+_sender_lock = threading.Lock ()
+_sender: Optional [ threading.Thread ] = None
+
+# Messages queued but not yet sent, failed or dropped; flush_telegram_messages waits on it
+_pending = 0
+_pending_changed = threading.Condition ()
+
+
+def _message_done () -> None:
+    global _pending
+    with _pending_changed:
+        _pending -= 1
+        _pending_changed.notify_all ()
+
+
+def _sender_loop () -> None:
+    while True:
+        message, parse_mode, on_sent = _outbox.get ()
+        try:
+            if send_telegram_message ( message, parse_mode=parse_mode ) and on_sent is not None:
+                on_sent ()
+        except Exception as e:
+            print ( f"Error after sending Telegram message: {e}" )
+        finally:
+            _message_done ()
+
+
+def enqueue_telegram_message ( message: str, parse_mode: str = None,
+                               on_sent: Optional [ Callable [ [ ], None ] ] = None ) -> None:
+    """
+    Queue a message for delivery by the background sender and return immediately.
+
+    on_sent, if given, is called from the sender thread once Telegram has accepted the message.
+    """
+    global _sender, _pending
+    with _sender_lock:
+        if _sender is None:
+            _sender = threading.Thread ( target=_sender_loop, name="telegram-sender", daemon=True )
+            _sender.start ()
+    with _pending_changed:
+        _pending += 1
+    _outbox.put ( ( message, parse_mode, on_sent ) )
+
+
+# Longest time flush_telegram_messages waits before dropping what is still queued
+FLUSH_TIMEOUT = 30
+
+
+def flush_telegram_messages ( timeout: float = FLUSH_TIMEOUT ) -> bool:
+    """
+    Wait until every queued message has been sent (or has failed), for at most timeout seconds.
+
+    Messages still queued at the deadline are dropped, so a hung request or a repeating 429
+    cannot keep the cycle process from exiting. Returns True if the queue was fully drained.
+    """
+    with _pending_changed:
+        if _pending_changed.wait_for ( lambda: _pending == 0, timeout ):
+            return True
+
+    dropped = 0
+    while True:
+        try:
+            _outbox.get_nowait ()
+        except queue.Empty:
+            break
+        _message_done ()
+        dropped += 1
+    print ( f"Telegram flush timed out after {timeout}s; dropped {dropped} queued message(s)" )
+    return False
+
+
+# Seconds to wait for the user's reply during interactive wallet setup
+SETUP_TIMEOUT = 300
+
+# Prompt sent when interactive wallet setup starts; {intro} lists the node's wallets
+_SETUP_MSG = (
+    "<b>⚠️ TeleShake Setup Required ⚠️</b>\n\n"
+    "{intro}\n\n"
+    "Input <b>Wallet</b> and <b>Passphrase</b> separated by a colon (:).\n"
+    "<b>(Response required within 5 minutes)</b>\n"
+    "<i>Example:</i>\n<code>skywirex:secretpass123</code>"
+)
 
 
 def interactive_wallet_setup ( wallet_instance: Any, wallets: List [ str ] ) -> bool:
@@ -51,46 +203,43 @@ def interactive_wallet_setup ( wallet_instance: Any, wallets: List [ str ] ) ->
         print ( "Telegram bot not configured for interactive setup." )
         return False
 
+    # Deliver pending alerts first so they arrive before the setup prompt
+    flush_telegram_messages ()
+
     # --- [CHECK 1] PRINT BEFORE UPDATE ---
     print ( "\n--------- CHECKING CONFIG FILE (BEFORE) ---------" )
     try:
-        with open ( CONFIG_FILE, 'r' ) as f:
-            data = json.load ( f )
-            print ( f"Current WALLET_ID:         {data.get ( 'WALLET_ID' )}" )
-            print ( f"Current WALLET_PASSPHRASE: {data.get ( 'WALLET_PASSPHRASE' )}" )
+        data = load_config ()
+        print ( f"Current WALLET_ID:         {data.get ( 'WALLET_ID' )}" )
+        print ( f"Current WALLET_PASSPHRASE: {data.get ( 'WALLET_PASSPHRASE' )}" )
     except Exception as e:
         print ( f"Could not read config: {e}" )
+        data = None
     print ( "-------------------------------------------------\n" )
     # -------------------------------------------------------
 
     # 1. Construct and send the prompt
     if wallets:
-        wallet_list_str = "\n".join ( [ f"- <code>{w}</code>" for w in wallets ] )
+        wallet_list_str = "\n".join ( f"- <code>{w}</code>" for w in wallets )
         intro_text = f"The following wallets on your node:\n{wallet_list_str}"
     else:
         intro_text = "<b>Could not automatically list wallets.</b>"
 
-    msg_text = (
-        f"<b>⚠️ TeleShake Setup Required ⚠️</b>\n\n"
-        f"{intro_text}\n\n"
-        f"Input <b>Wallet</b> and <b>Passphrase</b> separated by a colon (:).\n"
-        f"<b>(Response required within 5 minutes)</b>\n"
-        f"<i>Example:</i>\n<code>skywirex:secretpass123</code>"
-    )
+    msg_text = _SETUP_MSG.format ( intro=intro_text )
 
     try:
-        bot.send_message ( TELEGRAM_CHAT_ID, msg_text, parse_mode="HTML" )
-        print ( "Waiting for user input via Telegram (2-minute timeout)..." )
+        _send_rate_limited ( TELEGRAM_CHAT_ID, msg_text, parse_mode="HTML" )
+        print ( f"Waiting for user input via Telegram ({SETUP_TIMEOUT // 60}-minute timeout)..." )
     except Exception as e:
         print ( f"Error sending setup message: {e}" )
         return False
 
-    status = [ False ]
+    success = False
 
     # 2. Define the handler for the user's response
-    @bot.message_handler ( func=lambda m: str ( m.chat.id ) == str ( TELEGRAM_CHAT_ID ) )
     def handle_wallet_selection ( message ):
-        text = message.text.strip ()
+        nonlocal success
+        text = ( message.text or '' ).strip ()
         parts = text.split ( ':', 1 )
 
         if len ( parts ) < 2:
@@ -117,32 +266,56 @@ def interactive_wallet_setup ( wallet_instance: Any, wallets: List [ str ] ) ->
 
         # 3. Update config.json
         try:
-            current_config = load_config ()
-            current_config [ 'WALLET_ID' ] = wallet_id
-            current_config [ 'WALLET_PASSPHRASE' ] = passphrase
+            # Start from the config read above, retrying if that failed
+            current_config = data if data is not None else load_config ()
+            current_config.update ( WALLET_ID=wallet_id, WALLET_PASSPHRASE=passphrase )
 
-            with open ( CONFIG_FILE, 'w' ) as f:
-                json.dump ( current_config, f, indent=2 )
+            with open ( CONFIG_FILE, 'wb' ) as f:
+                f.write ( dumps_indented ( current_config ) )
 
             # --- [CHECK 2] PRINT AFTER UPDATE ---
             print ( "\n--------- CHECKING CONFIG FILE (AFTER) ---------" )
-            with open ( CONFIG_FILE, 'r' ) as f:
-                new_data = json.load ( f )
+            print ( f"Current WALLET_ID:         {current_config [ 'WALLET_ID' ]}" )
+            print ( f"Current WALLET_PASSPHRASE: {current_config [ 'WALLET_PASSPHRASE' ]}" )
             # ------------------------------------------------------
 
             bot.reply_to ( message, f"✅ <b>Updated!</b>\n\nWallet: <b>{wallet_id}</b>\n\n ⏳ Waiting ...", parse_mode="HTML" )
 
-            status [ 0 ] = True
-            bot.stop_polling ()
+            success = True
 
         except Exception as e:
             bot.reply_to ( message, f"Error saving config: {e}" )
-            status [ 0 ] = False
+            success = False
 
-    # 4. Start polling
-    try:
-        bot.polling ( timeout=300 )
-    except Exception as e:
-        print ( f"Polling stopped: {e}" )
+    # 4. Long-poll getUpdates directly until a valid reply arrives or the deadline passes
+    deadline = time.monotonic () + SETUP_TIMEOUT
+    offset = None
+    while not success:
+        remaining = int ( deadline - time.monotonic () )
+        if remaining <= 0:
+            print ( "Timed out waiting for wallet setup reply." )
+            break
+        wait = min ( remaining, 50 )
+        try:
+            updates = bot.get_updates ( offset=offset, timeout=wait + 10, allowed_updates=[ "message" ],
+                                        long_polling_timeout=wait )
+        except Exception as e:
+            print ( f"Polling stopped: {e}" )
+            break
+
+        for update in updates:
+            offset = update.update_id + 1
+            message = update.message
+            if message and str ( message.chat.id ) == str ( TELEGRAM_CHAT_ID ):
+                handle_wallet_selection ( message )
+                if success:
+                    break
+
+    # Acknowledge handled updates so the next setup does not see them again
+    if offset is not None:
+        try:
+            bot.get_updates ( offset=offset, timeout=10, long_polling_timeout=0 )
+        except Exception as e:
+            print ( f"Could not acknowledge Telegram updates: {e}" )
 
-    return status [ 0 ]
\ No newline at end of file
+    return success
\ No newline at end of file
@@ -1,18 +1,97 @@
+import hashlib
+import logging
+import os
+import sys
+import time
 from datetime import datetime
+from typing import Any, Dict, List
 
-# Import bot functions and utility for loading config
-from bot_telegram import send_telegram_message, interactive_wallet_setup, load_config
+from api.serialization import dumps, loads
+# Config loading is cheap; the Telegram client is imported only when a message is sent
+from bot_config import CONFIG_FILE, load_config
 
 # Import existing utils
 from name_manager import (
     WALLET, HSD, HandshakeNameManager
 )
 
-CONFIG_FILE = 'config.json'
+# WALLET_ID values that mean no wallet has been configured yet
+_UNSET_WALLET_IDS = frozenset ( ( None, "", "primary" ) )
+
+# Digest and time of the last status message, used when NOTIFY_ONLY_ON_CHANGE is enabled
+NOTIFY_STATE_FILE = 'last_notification.json'
+DEFAULT_NOTIFY_HEARTBEAT_HOURS = 24
+
+# Static footer appended to every status message
+_SUPPORT_FOOTER = "\n".join ( [
+    "\n<b>🙏 SUPPORT & DONATE:</b>",
+    "HNS: <code>hs1qwrsfl8vkjqxfdncfn00dtzvpcdcj3rlj70zg3m</code>",
+] )
+
+# Status message layout, filled once per cycle with format_map
+STATUS_TEMPLATE = (
+    "<b>TeleShake Update ({ts})</b>\n"
+    "\n<b>INFO:</b>\n"
+    "Account: <code>{account}</code> | Height: <code>{block_height}</code>\n"
+    "Balance: <code>{balance} HNS</code> | Name: <code>{names_in_wallet}</code>\n"
+    "Address: <code>{full_receiving_address}</code>\n"
+    "\n<b>SOONEST EXPIRING NAME:</b>\n"
+    "{soonest_block}\n"
+    "\n<b>RENEWAL (in <code>{threshold_days}</code> DAYS):</b>\n"
+    "{renewal_block}\n"
+) + _SUPPORT_FOOTER
+
+
+def _send_alerts ( pending_alerts: List [ str ] ) -> None:
+    """Queue the collected alerts as one Telegram message and clear the list."""
+    if pending_alerts:
+        from bot_telegram import enqueue_telegram_message
+        enqueue_telegram_message ( "\n\n".join ( pending_alerts ), parse_mode="HTML" )
+        pending_alerts.clear ()
+
+
+def _status_digest ( info: Dict [ str, Any ], soonest_expiring: Dict [ str, Any ] ) -> str:
+    """Hash the parts of the status that matter to the user; block height moves every cycle and is left out."""
+    state = ( info [ 'account' ], info [ 'balance' ], info [ 'names_in_wallet' ], info [ 'full_receiving_address' ],
+              soonest_expiring [ 'name' ], soonest_expiring [ 'days_until_expire' ] )
+    return hashlib.blake2b ( repr ( state ).encode (), digest_size=16 ).hexdigest ()
+
+
+def _status_changed ( digest: str, heartbeat_seconds: float ) -> bool:
+    """Return True if the digest differs from the last sent status, or that status is older than the heartbeat."""
+    try:
+        with open ( NOTIFY_STATE_FILE, 'rb' ) as f:
+            last = loads ( f.read () )
+    except ( FileNotFoundError, ValueError ):
+        return True
+    if not isinstance ( last, dict ):
+        return True
+    return last.get ( 'digest' ) != digest or time.time () - last.get ( 'sent_at', 0 ) >= heartbeat_seconds
+
+
+def _remember_status ( digest: str ) -> None:
+    """Record the digest of the status message that was just sent."""
+    # Write a temp file and swap it in, so an interrupted write can't leave a truncated state file
+    tmp_file = NOTIFY_STATE_FILE + ".tmp"
+    with open ( tmp_file, 'wb' ) as f:
+        f.write ( dumps ( { 'digest': digest, 'sent_at': time.time () } ) )
+    os.replace ( tmp_file, NOTIFY_STATE_FILE )
 
 
 def main ():
     """Run a single cycle – designed to be called by a script"""
+    # Alerts raised during the cycle are sent together, as one message
+    pending_alerts: List [ str ] = [ ]
+    try:
+        _run_cycle ( pending_alerts )
+    finally:
+        _send_alerts ( pending_alerts )
+
+
+def _run_cycle ( pending_alerts: List [ str ] ) -> None:
+    """Verify the wallet config, run setup if needed, then renew names and report status."""
+    # One timestamp for the whole cycle keeps renewal decisions and the report consistent
+    cycle_now = datetime.now ()
 
     # Instantiate API clients (needed early for setup/verification)
     wallet = WALLET ()
@@ -26,7 +105,7 @@ def main ():
     setup_needed = False
 
     # 1. Check if ID is missing or default
-    if current_wallet_id in [ None, "", "primary" ]:
+    if current_wallet_id in _UNSET_WALLET_IDS:
         print ( ">>> Config Status: Wallet ID not set." )
         setup_needed = True
 
@@ -45,7 +124,7 @@ def main ():
                                 f"Passphrase or wallet is incorrect.\n\n"
 
                 print ( ">>> ❌ Passphrase verification FAILED. stored passphrase is incorrect." )
-                send_telegram_message ( error_message, parse_mode="HTML" )  # Send alert to Telegram
+                pending_alerts.append ( error_message )  # Send alert to Telegram
 
                 setup_needed = True
 
@@ -57,7 +136,7 @@ def main ():
                             f"Initiating interactive setup via Telegram now."
 
             print ( f">>> ⚠️ Error connecting to node to verify wallet: {e}" )
-            send_telegram_message ( error_message, parse_mode="HTML" )  # Send alert to Telegram
+            pending_alerts.append ( error_message )  # Send alert to Telegram
 
             setup_needed = True
 
@@ -65,13 +144,17 @@ def main ():
     if setup_needed:
         print ( ">>> Initiating interactive setup via Telegram..." )
 
-        # Get list of available wallets
-        try:
-            wallets = wallet.list_wallets ()
-        except:
+        # Get list of available wallets; the wallet session already retries the GET
+        wallets = wallet.list_wallets ()
+        if not isinstance ( wallets, list ):
+            print ( f">>> Could not list wallets: {wallets.get ( 'error' ) if isinstance ( wallets, dict ) else wallets}" )
             wallets = [ ]
 
+        # Alerts explaining why setup is needed go out before the setup prompt
+        _send_alerts ( pending_alerts )
+
         # Start Telegram interaction
+        from bot_telegram import interactive_wallet_setup
         setup_successful = interactive_wallet_setup ( wallet, wallets )
 
         if setup_successful:
@@ -98,56 +181,69 @@ def main ():
                         f"Error: <code>{str ( e )}</code>\n\n" \
                         f"Exiting cycle."
         print ( f">>> ❌ Manager Initialization FAILED: {e}" )
-        send_telegram_message ( error_message, parse_mode="HTML" )
+        pending_alerts.append ( error_message )
         return
 
     # --- STEP 4: Standard Logic (Using Manager) ---
     try:
         # Check wallet is now done inside HandshakeNameManager.__init__
 
-        manager.fetch_and_save_names ()
-        renewed_names = manager.renew_expiring_names ()
+        manager.fetch_and_save_names ( now=cycle_now )
+        renewed_names = manager.renew_expiring_names ( now=cycle_now )
         info = manager.get_status_info ()
-        soonest_expiring = manager.get_soonest_expiring_name ()
+        soonest_expiring = manager.get_soonest_expiring_name ( now=cycle_now )
 
         # === Build the message ===
-        message_lines = [ f"<b>TeleShake Update ({datetime.now ().strftime ( '%Y-%m-%d %H:%M:%S' )})</b>",
-                          "\n<b>INFO:</b>",
-                          f"Account: <code>{info [ 'account' ]}</code> | Height: <code>{info [ 'block_height' ]}</code>",
-                          f"Balance: <code>{info [ 'balance' ]} HNS</code> | Name: <code>{info["names_in_wallet"]}</code>",
-                          f"Address: <code>{info [ 'full_receiving_address' ]}</code>",
-                          "\n<b>SOONEST EXPIRING NAME:</b>" ]
-
         if soonest_expiring [ "name" ]:
-            message_lines.append ( f"Name: <code>{soonest_expiring [ 'name' ]}</code>" )
-            message_lines.append ( f"Expires: <code>{soonest_expiring [ 'expiration_date' ]}</code>" )
-            message_lines.append ( f"Days until expiration: <code>{soonest_expiring [ 'days_until_expire' ]}</code>" )
+            soonest_block = f"Name: <code>{soonest_expiring [ 'name' ]}</code>\n" \
+                            f"Expires: <code>{soonest_expiring [ 'expiration_date' ]}</code>\n" \
+                            f"Days until expiration: <code>{soonest_expiring [ 'days_until_expire' ]}</code>"
         else:
-            message_lines.append ( "No names found" )
+            soonest_block = "No names found"
 
-        message_lines.append ( f"\n<b>RENEWAL (in <code>{manager.threshold_days}</code> DAYS):</b>" )
         if renewed_names:
-            message_lines.append ( "Renewed the following names:" )
-            message_lines.extend ( [ f"- <code>{name}</code>" for name in renewed_names ] )
+            renewal_block = "Renewed the following names:\n" + "\n".join (
+                f"- <code>{name}</code>" for name in renewed_names )
         else:
-            message_lines.append ( "No names required renewal" )
-
-        message_lines.append("\n<b>🙏 SUPPORT & DONATE:</b>")
-        message_lines.append("HNS: <code>hs1qwrsfl8vkjqxfdncfn00dtzvpcdcj3rlj70zg3m</code>")
-
-
-        message = "\n".join ( message_lines )
-        send_telegram_message ( message, parse_mode="HTML" )
-        print ( f"{datetime.now ()} - Cycle completed successfully." )
+            renewal_block = "No names required renewal"
+
+        message = STATUS_TEMPLATE.format_map ( dict (
+            info,
+            ts=cycle_now.strftime ( '%Y-%m-%d %H:%M:%S' ),
+            soonest_block=soonest_block,
+            renewal_block=renewal_block,
+            threshold_days=manager.threshold_days
+        ) )
+
+        # Optionally stay quiet while nothing changed, but still send a periodic heartbeat;
+        # a cycle that renewed names is always reported
+        digest = None
+        if config.get ( 'NOTIFY_ONLY_ON_CHANGE', False ):
+            digest = _status_digest ( info, soonest_expiring )
+            heartbeat_hours = config.get ( 'NOTIFY_HEARTBEAT_HOURS', DEFAULT_NOTIFY_HEARTBEAT_HOURS )
+            if not renewed_names and not _status_changed ( digest, heartbeat_hours * 3600 ):
+                print ( f"{cycle_now} - Status unchanged, notification skipped." )
+                return
+
+        from bot_telegram import enqueue_telegram_message
+        # The digest is only recorded once Telegram accepted the message, so a failed
+        # send is retried next cycle instead of being suppressed until the heartbeat
+        on_sent = ( lambda: _remember_status ( digest ) ) if digest is not None else None
+        enqueue_telegram_message ( message, parse_mode="HTML", on_sent=on_sent )
+        print ( f"{cycle_now} - Cycle completed successfully." )
 
     except Exception as e:
-        error_message = f"<b>Teleshake ERROR ({datetime.now ().strftime ( '%Y-%m-%d %H:%M' )}):</b>\n{str ( e )}"
+        error_message = f"<b>Teleshake ERROR ({cycle_now.strftime ( '%Y-%m-%d %H:%M' )}):</b>\n{str ( e )}"
         print ( f"Error: {e}" )
-        try:
-            send_telegram_message ( error_message, parse_mode="HTML" )
-        except:
-            pass
+        pending_alerts.append ( error_message )
 
 
 if __name__ == "__main__":
-    main ()
\ No newline at end of file
+    logging.basicConfig ( level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s' )
+    try:
+        main ()
+    finally:
+        # Alerts are sent in the background; let them go out before exiting
+        bot_telegram = sys.modules.get ( 'bot_telegram' )
+        if bot_telegram is not None:
+            bot_telegram.flush_telegram_messages ()
\ No newline at end of file
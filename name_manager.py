@@ -1,9 +1,26 @@
 import json
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 from api.hsd import HSD
+from api.serialization import dumps, loads
 from api.wallet import WALLET
+from bot_config import CONFIG_FILE, read_config
+
+# Wallet amounts are integers in dollarydoos, the smallest HNS unit
+DOLLARYDOOS_PER_HNS = 1_000_000
+
+
+class HsdRpcError(RuntimeError):
+    """Raised when the wallet or node API answers with an error response."""
+
+
+def _checked(response: Any) -> Any:
+    """Return an API response unchanged, raising HsdRpcError if it is an error dict."""
+    if isinstance(response, dict) and "error" in response:
+        raise HsdRpcError(response["error"])
+    return response
 
 
 class HandshakeNameManager:
@@ -24,7 +41,7 @@ class HandshakeNameManager:
 
     def __init__(
         self,
-        config_path: str = "config.json",
+        config_path: str = CONFIG_FILE,
         wallet: Optional[Any] = None,
         hsd: Optional[Any] = None
     ):
@@ -45,37 +62,42 @@ class HandshakeNameManager:
         self.passphrase = self.config.get("WALLET_PASSPHRASE", self.DEFAULT_CONFIG["WALLET_PASSPHRASE"])
         self.names_file = self.config.get("NAMES_JSON_FILE", self.DEFAULT_CONFIG["NAMES_JSON_FILE"])
 
+        # Names data from the last fetch or file read, shared by the renewal and status steps
+        self._names: Optional[Dict[str, Any]] = None
+        # Earliest expiration_ts from the last fetch; lets renewal skip the scan when nothing is close
+        self._soonest_ts: Optional[int] = None
+
         # Validate wallet immediately
         self.check_wallet_exists()
 
     @staticmethod
     def _load_config(config_path: str) -> Dict[str, Any]:
-        if not os.path.exists(config_path):
-            raise FileNotFoundError(f"Configuration file {config_path} not found")
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        # Shares the mtime-keyed cache with main.py's load_config, so the file is parsed once per change
+        return read_config(config_path)
 
     def check_wallet_exists(self) -> None:
         """Raise error if wallet doesn't exist (no auto-creation)."""
-        response = self.wallet.get_wallet_info(self.wallet_id)
-        # Guard for non-dict responses from the wallet API
-        if not isinstance(response, dict) or "error" in response:
-            error_text = response.get('error') if isinstance(response, dict) else str(response)
+        try:
+            response = _checked(self.wallet.get_wallet_info(self.wallet_id))
+            # Guard for non-dict responses from the wallet API
+            if not isinstance(response, dict):
+                raise HsdRpcError(str(response))
+        except HsdRpcError as e:
             error_msg = (
                 f"Wallet '{self.wallet_id}' does NOT exist.\n"
-                f"Import the Wallet first manually first using `curl` command provided in the README file. Error: {error_text}"
+                f"Import the Wallet first manually first using `curl` command provided in the README file. Error: {e}"
             )
             # Log error but don't crash init if strictly just checking
             print(error_msg)
-            raise RuntimeError(error_msg)
+            raise HsdRpcError(error_msg) from None
         print(f"Wallet '{self.wallet_id}' is ready.")
 
     @staticmethod
-    def _get_expiration_date(name_info: Dict[str, Any]) -> datetime:
+    def _get_expiration_date(name_info: Dict[str, Any], now: datetime) -> datetime:
         # Ensure name_info is a dict before using .get()
         if not isinstance(name_info, dict):
             print("Warning: name_info is not a dict; assuming far future")
-            return datetime.now() + timedelta(days=730)
+            return now + timedelta(days=730)
 
         stats = name_info.get("stats", {})
         if not isinstance(stats, dict):
@@ -85,15 +107,26 @@ class HandshakeNameManager:
         if days_until_expire is None:
             name_display = name_info.get("name", "<unknown>")
             print(f"Warning: No expiration data for '{name_display}', assuming far future")
-            return datetime.now() + timedelta(days=730)
+            return now + timedelta(days=730)
 
-        return datetime.now() + timedelta(days=days_until_expire)
+        return now + timedelta(days=days_until_expire)
 
-    def fetch_and_save_names(self) -> None:
-        """Fetch all owned names from wallet and save to JSON with expiration info."""
-        response = self.wallet.get_wallet_names_own(self.wallet_id)
-        if "error" in response:
-            raise RuntimeError(f"Failed to fetch names: {response['error']}")
+    @staticmethod
+    def _expiration_ts(data: Dict[str, Any]) -> int:
+        # Names files written before expiration_ts was stored only carry the ISO date
+        ts = data.get("expiration_ts")
+        if ts is None:
+            ts = int(datetime.fromisoformat(data["expiration_date"]).timestamp())
+        return ts
+
+    def fetch_and_save_names(self, now: Optional[datetime] = None) -> None:
+        """Fetch all owned names from wallet and save to JSON with expiration info, relative to now."""
+        if now is None:
+            now = datetime.now()
+        try:
+            response = _checked(self.wallet.get_wallet_names_own(self.wallet_id))
+        except HsdRpcError as e:
+            raise HsdRpcError(f"Failed to fetch names: {e}") from None
 
         names_data = {}
         for name_info in response:
@@ -106,64 +139,101 @@ class HandshakeNameManager:
                 print("Warning: Skipping entry with missing 'name' key")
                 continue
             try:
-                expiration_date = self._get_expiration_date(name_info)
+                expiration_date = self._get_expiration_date(name_info, now)
                 names_data[name] = {
                     "expiration_date": expiration_date.isoformat(),
+                    # Unix seconds, so renewal checks compare ints instead of parsing the ISO string
+                    "expiration_ts": int(expiration_date.timestamp()),
                     "renewal_height": name_info.get("renewal", 0),
                     "days_until_expire": (name_info.get("stats") or {}).get("daysUntilExpire"),
                 }
             except Exception as e:
                 print(f"Error processing '{name}': {e}")
 
-        with open(self.names_file, 'w') as f:
-            json.dump(names_data, f, indent=4)
+        # Write a temp file and swap it in, so readers never see a half-written file
+        tmp_file = self.names_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            # Compact output: the file is machine-read cache, not hand-edited config
+            f.write(dumps(names_data))
+        os.replace(tmp_file, self.names_file)
+        self._names = names_data
+        self._soonest_ts = min((self._expiration_ts(data) for data in names_data.values()), default=None)
         print(f"Saved {len(names_data)} names to {self.names_file}")
 
     def load_names(self) -> Dict[str, Any]:
-        """Load names from JSON file."""
-        if not os.path.exists(self.names_file):
-            raise FileNotFoundError(f"{self.names_file} not found. Run fetch_and_save_names() first.")
-        with open(self.names_file, 'r') as f:
-            return json.load(f)
-
-    def renew_expiring_names(self) -> List[str]:
-        """Renew all names expiring within RENEWAL_THRESHOLD_DAYS. Returns renewed names."""
+        """Load names from the last fetch, reading the JSON file only if none was done yet."""
+        if self._names is not None:
+            return self._names
+        try:
+            with open(self.names_file, 'rb') as f:
+                self._names = loads(f.read())
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{self.names_file} not found. Run fetch_and_save_names() first.") from None
+        return self._names
+
+    def renew_expiring_names(self, now: Optional[datetime] = None) -> List[str]:
+        """Renew all names expiring within RENEWAL_THRESHOLD_DAYS of now. Returns renewed names."""
+        threshold_ts = int((now or datetime.now()).timestamp()) + self.threshold_days * 86400
+        if self._soonest_ts is not None and self._soonest_ts > threshold_ts:
+            return []
+
         try:
             names_data = self.load_names()
         except FileNotFoundError:
             print("No names file found. Please fetch names first.")
             return []
 
-        threshold_date = datetime.now() + timedelta(days=self.threshold_days)
         renewed = []
 
         for name, data in names_data.items():
-            exp_date = datetime.fromisoformat(data["expiration_date"])
-            if exp_date <= threshold_date:
-                print(f"Renewing '{name}' — expires {exp_date.date()}")
-                result = self.wallet.send_renew(
-                    id=self.wallet_id,
-                    passphrase=self.passphrase,
-                    name=name,
-                    sign=True,
-                    broadcast=True
-                )
-                if "error" in result:
-                    print(f"Failed to renew '{name}': {result['error']}")
-                else:
-                    renewed.append(name)
-                    print(f"Successfully renewed '{name}'")
+            if self._expiration_ts(data) <= threshold_ts:
+                print(f"Renewing '{name}' — expires {data['expiration_date'][:10]}")
+                # hsd serializes wallet sends behind its fund lock, so renewals go one at a time;
+                # sending them concurrently would only queue them on the node
+                try:
+                    _checked(self.wallet.send_renew(
+                        id=self.wallet_id,
+                        passphrase=self.passphrase,
+                        name=name,
+                        sign=True,
+                        broadcast=True
+                    ))
+                except HsdRpcError as e:
+                    # One failed renewal shouldn't stop the others
+                    print(f"Failed to renew '{name}': {e}")
+                    continue
+                renewed.append(name)
+                print(f"Successfully renewed '{name}'")
 
         return renewed
 
+    @staticmethod
+    def _status_lookup(future: Future) -> Optional[Dict[str, Any]]:
+        """Return a status lookup's response dict, or None if the API answered with an error."""
+        try:
+            response = _checked(future.result())
+        except HsdRpcError as e:
+            print(f"Status lookup failed: {e}")
+            return None
+        # Guard for non-dict responses from the API
+        return response if isinstance(response, dict) else None
+
     def get_status_info(self) -> Dict[str, Any]:
         """Get node, wallet balance, and receive address."""
         info = {"account": self.wallet_id}
 
+        # The three lookups are independent, so wait for the slowest instead of their sum
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            node_future = executor.submit(self.hsd.get_info)
+            balance_future = executor.submit(self.wallet.get_balance, id=self.wallet_id)
+            acct_future = executor.submit(self.wallet.get_account_info, id=self.wallet_id)
+        node_info = self._status_lookup(node_future)
+        balance_info = self._status_lookup(balance_future)
+        acct_info = self._status_lookup(acct_future)
+
+        # Failed lookups show as "Error" so the rest of the report still goes out
         # Node info
-        node_info = self.hsd.get_info()
-        # Ensure we have a dict and no error key before using dict methods
-        if isinstance(node_info, dict) and "error" not in node_info:
+        if node_info is not None:
             chain = node_info.get("chain")
             if isinstance(chain, dict):
                 info["block_height"] = chain.get("height", "Unknown")
@@ -173,18 +243,16 @@ class HandshakeNameManager:
             info["block_height"] = "Error"
 
         # Balance
-        balance_info = self.wallet.get_balance(id=self.wallet_id)
-        if isinstance(balance_info, dict) and "error" not in balance_info:
+        if balance_info is not None:
             unconfirmed = balance_info.get("unconfirmed", 0)
             locked = balance_info.get("lockedUnconfirmed", 0)
-            spendable = (unconfirmed - locked) / 1_000_000
-            info["balance"] = round(spendable, 6)
+            # Subtract in integer dollarydoos; convert to HNS once, for display
+            info["balance"] = round((unconfirmed - locked) / DOLLARYDOOS_PER_HNS, 6)
         else:
             info["balance"] = "Error"
 
         # Receive address
-        acct_info = self.wallet.get_account_info(id=self.wallet_id)
-        if isinstance(acct_info, dict) and "error" not in acct_info:
+        if acct_info is not None:
             full_addr = acct_info.get("receiveAddress", "Error")
         else:
             full_addr = "Error"
@@ -205,11 +273,8 @@ class HandshakeNameManager:
 
         return info
 
-    def get_soonest_expiring_name(self) -> Dict[str, Optional[Any]]:
-        """Return the name that will expire soonest."""
-        if not os.path.exists(self.names_file):
-            return {"name": None, "expiration_date": None, "days_until_expire": None}
-
+    def get_soonest_expiring_name(self, now: Optional[datetime] = None) -> Dict[str, Optional[Any]]:
+        """Return the name that will expire soonest, with its days left counted from now."""
         try:
             names_data = self.load_names()
         except FileNotFoundError:
@@ -218,20 +283,14 @@ class HandshakeNameManager:
         if not names_data:
             return {"name": None, "expiration_date": None, "days_until_expire": None}
 
-        soonest_name = None
-        soonest_date = None
-
-        for name, data in names_data.items():
-            exp_date = datetime.fromisoformat(data["expiration_date"])
-            if soonest_date is None or exp_date < soonest_date:
-                soonest_date = exp_date
-                soonest_name = name
-
-        days_left = (soonest_date - datetime.now()).days if soonest_date else None
+        # Compare the integer timestamps; only the winner's ISO date is parsed
+        soonest_name, soonest_data = min(names_data.items(), key=lambda item: self._expiration_ts(item[1]))
+        soonest_date = datetime.fromisoformat(soonest_data["expiration_date"])
+        days_left = (soonest_date - (now or datetime.now())).days
 
         return {
             "name": soonest_name,
-            "expiration_date": soonest_date.strftime("%Y-%m-%d %H:%M") if soonest_date else None,
+            "expiration_date": soonest_date.strftime("%Y-%m-%d %H:%M"),
             "days_until_expire": days_left
         }
 
@@ -283,15 +342,19 @@ if __name__ == "__main__":
 
     # Inject expiring data to test renewal
     print("\n--- Simulating Expiring Name ---")
+    urgent_date = datetime.now() + timedelta(days=5)
     mock_names_data = {
         "urgent.hns": {
-            "expiration_date": (datetime.now() + timedelta(days=5)).isoformat(),
+            "expiration_date": urgent_date.isoformat(),
+            "expiration_ts": int(urgent_date.timestamp()),
             "renewal_height": 999,
             "days_until_expire": 5
         }
     }
     with open('wallet_names.json', 'w') as f:
         json.dump(mock_names_data, f)
+    manager._names = None  # Drop the in-memory copy so the injected file is read
+    manager._soonest_ts = None
 
     print("\n--- Renewing names nearing expiration ---")
     renewed = manager.renew_expiring_names()
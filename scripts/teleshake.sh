@@ -12,6 +12,9 @@ fi
 
 echo "teleshake started — running every ${LOOP_SECONDS} seconds"
 
+# Schedule against a fixed deadline so the time spent in main.py doesn't add to the period
+NEXT_RUN=$(date +%s)
+
 while true; do
     echo "=== $(date '+%Y-%m-%d %H:%M:%S %Z') === Running main.py (loop=${LOOP_SECONDS}s)"
 
@@ -24,6 +27,14 @@ while true; do
         echo "main.py failed with exit code $EXIT_CODE"
     fi
 
-    echo "Sleeping ${LOOP_SECONDS} seconds..."
-    sleep "$LOOP_SECONDS"
+    NEXT_RUN=$((NEXT_RUN + LOOP_SECONDS))
+    NOW=$(date +%s)
+    if [ "$NEXT_RUN" -le "$NOW" ]; then
+        # The run overran the period: start the next one now, without trying to catch up on missed runs
+        NEXT_RUN=$NOW
+    fi
+    SLEEP_SECONDS=$((NEXT_RUN - NOW))
+
+    echo "Sleeping ${SLEEP_SECONDS} seconds..."
+    sleep "$SLEEP_SECONDS"
 done
\ No newline at end of file